@@ -0,0 +1,171 @@
+"""Parse AmEx bank statement PDFs into a transactions DataFrame.
+
+Each statement page is scanned line by line; a line starting with an
+MM/DD/YYYY date opens a new transaction, and following lines (until the
+next date) are folded into its description. Dollar amounts are picked up
+as credits, debits (parenthesized), or the running balance.
+"""
+
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import fitz  # PyMuPDF
+import pandas as pd
+
+try:
+    # google-re2: linear-time DFA matching, much faster for the
+    # multi-literal alternations below. Optional; re works fine too.
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+EXCLUDE_PATTERNS = [
+    'Beginning Balance',
+    'Ending Balance',
+    'Total Deposits',
+    'Total Withdrawals',
+    'Annual Percentage Yield Earned',
+    'Days in Billing Cycle',
+]
+
+# Compiled once: these run against every line of every page.
+DATE_WITH_DESC_RE = re.compile(r"^(\d{2}/\d{2}/\d{4})\s*(.*)")
+DATE_RE_ANYWHERE = re.compile(r'(?m)^\d{2}/\d{2}/\d{4}')
+AMOUNT_RE = re.compile(r'\(?\$[\d,]+\.\d{2}\)?')
+_filter_re = _re2 if _re2 is not None else re
+EXCLUDE_RE = _filter_re.compile('|'.join(EXCLUDE_PATTERNS), _filter_re.IGNORECASE)
+HEADER_RE = _filter_re.compile(r'\b(Date|Description|Credits|Debits|Balance)\b')
+
+
+def _to_num(s):
+    """Parse a statement amount: '($1,234.56)' -> -1234.56, '$12.34' -> 12.34."""
+    if s.startswith('('):
+        return -float(s.strip('()').lstrip('$').replace(',', ''))
+    return float(s.lstrip('$').replace(',', ''))
+
+
+def parse_one(file_path):
+    """Parse one statement PDF into parallel column lists.
+
+    Returns (dates, descriptions, credits, debits, balances). Column-wise
+    accumulation lets pandas build each Series directly instead of
+    transposing a row-major object matrix at DataFrame construction.
+    Kept as a module-level function so it can be shipped to workers.
+    """
+    dates, descs, credits, debits, balances = [], [], [], [], []
+    _excl = EXCLUDE_RE.search
+
+    with fitz.open(file_path) as doc:
+        for page in doc:
+            # sort=True gives deterministic reading order so the
+            # date/amount heuristics below stay stable across files.
+            content = page.get_text("text", sort=True)
+            # Disclosure text starts at "Important Notice"; drop it.
+            content = content.split('Important Notice')[0]
+            # Cover sheets, fee schedules etc. have no date-led lines at
+            # all; one scan of the page skips the whole line loop.
+            if not DATE_RE_ANYWHERE.search(content):
+                continue
+
+            # Strip and filter in a single pass: one .strip() per line,
+            # no intermediate list between the two filters.
+            lines = [s for s in (line.strip() for line in content.splitlines())
+                     if s and not _excl(s)]
+
+            in_transaction = False
+            cur_date = ''
+            cur_credit = cur_debit = cur_balance = None
+            description = []
+
+            def _flush():
+                # Clean the row once here rather than re-traversing the
+                # built columns with str.contains/apply afterwards.
+                desc = ' '.join(AMOUNT_RE.sub('', ' '.join(description)).split())
+                if _excl(desc):
+                    return
+                dates.append(cur_date)
+                descs.append(desc)
+                credits.append(_to_num(cur_credit) if cur_credit is not None else None)
+                debits.append(_to_num(cur_debit) if cur_debit is not None else None)
+                balances.append(_to_num(cur_balance) if cur_balance is not None else None)
+
+            for line in lines:
+                if HEADER_RE.search(line):
+                    continue
+                date_match = DATE_WITH_DESC_RE.match(line)
+                if date_match:
+                    if in_transaction:
+                        _flush()
+                    in_transaction = True
+                    cur_date = date_match.group(1)
+                    cur_credit = cur_debit = cur_balance = None
+                    description = []
+                    line = date_match.group(2)
+                if not in_transaction:
+                    continue
+                for amount in AMOUNT_RE.findall(line):
+                    if amount.startswith('('):
+                        # Parenthesized amounts are debits; a second one
+                        # on the same transaction is the balance.
+                        if cur_debit is None:
+                            cur_debit = amount
+                        else:
+                            cur_balance = amount
+                    else:
+                        if cur_credit is None and cur_debit is None:
+                            cur_credit = amount
+                        else:
+                            cur_balance = amount
+                if line:
+                    description.append(line)
+            if in_transaction:
+                _flush()
+
+    return dates, descs, credits, debits, balances
+
+
+def build_dataframe(columns):
+    """Turn the parallel column lists from parse_one into the DataFrame.
+
+    Rows arrive already cleaned (amounts stripped from descriptions,
+    whitespace squashed, excluded rows dropped), so this is just the
+    column assembly; the amount columns come out float64 with NaN for
+    sides a transaction doesn't have.
+    """
+    dates, descs, credits, debits, balances = columns
+    return pd.DataFrame({'Date': dates, 'Description': descs, 'Credits': credits,
+                         'Debits': debits, 'Balance': balances})
+
+
+def extract_transactions_from_pdf(file_path):
+    """Extract all transactions from one statement PDF.
+
+    Returns a DataFrame with Date, Description, Credits, Debits and
+    Balance columns; amounts are numeric (parenthesized debits negative).
+    """
+    return build_dataframe(parse_one(file_path))
+
+
+def main():
+    pdf_dir = sys.argv[1] if len(sys.argv) > 1 else 'statements'
+    pdf_paths = [os.path.join(pdf_dir, name)
+                 for name in sorted(os.listdir(pdf_dir))
+                 if name.lower().endswith('.pdf')]
+    if not pdf_paths:
+        return
+    # PDFs are independent and extraction is CPU-bound, so fan out
+    # across processes and build one DataFrame at the end.
+    columns = ([], [], [], [], [])
+    with ProcessPoolExecutor() as ex:
+        for result in ex.map(parse_one, pdf_paths, chunksize=4):
+            for dst, src in zip(columns, result):
+                dst.extend(src)
+    combined = build_dataframe(columns)
+    combined.to_csv('amex_transactions.csv', index=False)
+    print(f"Wrote {len(combined)} transactions to amex_transactions.csv")
+
+
+if __name__ == '__main__':
+    main()
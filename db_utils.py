@@ -0,0 +1,25 @@
+"""Shared PostgreSQL bulk-load helpers for the dashboard loaders."""
+
+import io
+
+
+def copy_buffer(conn, table, columns, buf):
+    """Stream an open headerless-CSV buffer into table via COPY FROM STDIN.
+
+    The caller owns the connection and the commit.
+    """
+    with conn.cursor() as cur:
+        cur.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)",
+            buf,
+        )
+
+
+def copy_dataframe(conn, table, df, columns=None):
+    """COPY a DataFrame into table, serializing to an in-memory CSV."""
+    if columns is None:
+        columns = list(df.columns)
+    buf = io.StringIO()
+    df.to_csv(buf, index=False, header=False, columns=columns)
+    buf.seek(0)
+    copy_buffer(conn, table, columns, buf)
@@ -0,0 +1,165 @@
+"""Load unified transaction CSV exports into the unified_transactions table.
+
+Transactions from every account land here in one shape: dates are
+normalized, amounts cleaned, calendar fiscal periods derived, and each
+file is staged as Parquet before being COPYed into PostgreSQL.
+"""
+
+import calendar
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+import psycopg2.pool
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pa_csv
+
+from db_utils import copy_buffer
+
+db_params = {
+    'dbname': 'dashboards',
+    'user': 'postgres',
+    'password': os.environ.get('POSTGRES_PASSWORD', ''),
+    'host': 'localhost',
+    'port': 5432,
+}
+
+PARQUET_DIR = 'parquet_unified'
+
+# Parquet writes and COPY release the GIL, so a few threads overlap one
+# file's compute with another's network I/O.
+MAX_WORKERS = 4
+
+COLUMNS = [
+    'transaction_date', 'description', 'amount', 'transaction_type',
+    'category', 'account', 'fiscal_year', 'fiscal_quarter', 'month',
+]
+
+
+@lru_cache(maxsize=None)
+def _fiscal_periods(year, month):
+    """Memoized (fiscal_year, fiscal_quarter, month_name) for one (year, month)."""
+    return year, (month - 1) // 3 + 1, calendar.month_name[month]
+
+
+def determine_fiscal_periods(date):
+    """Scalar fiscal-period lookup (calendar fiscal year).
+
+    preprocess_transaction_data uses the vectorized equivalent; this
+    stays as the reference implementation for spot checks and tests.
+    """
+    fiscal_year, fiscal_quarter, month_name = _fiscal_periods(date.year, date.month)
+    return {
+        'fiscal_year': fiscal_year,
+        'fiscal_quarter': fiscal_quarter,
+        'month': month_name,
+    }
+
+
+def preprocess_transaction_data(df):
+    """Build the unified_transactions layout from a raw transactions frame.
+
+    Returns a new frame holding only the output columns; the caller's
+    frame is read, never modified. Rows with unparseable dates are
+    dropped.
+    """
+    # Explicit format skips per-cell sniffing; cache=True dedupes repeat
+    # date strings. Unparseable dates are dropped rather than raising.
+    dt = pd.to_datetime(df['Date'], format='%m/%d/%Y', cache=True, errors='coerce')
+    valid = dt.notna()
+    df = df[valid]
+    dt = dt[valid]
+    # One regex pass for the currency column; fiscal periods come
+    # straight off the datetime Series instead of a per-row apply.
+    # The 'string' input makes to_numeric return nullable Float64, whose
+    # pd.NA would break the np.where mask below — cast back to float64
+    # so unparseable amounts become plain NaN.
+    amount = pd.to_numeric(
+        df['Amount'].astype('string').str.replace(r'[$,]', '', regex=True),
+        errors='coerce').astype('float64')
+    return pd.DataFrame({
+        'transaction_date': dt.dt.strftime('%Y-%m-%d'),
+        'description': df['Description'].astype(str).str.strip(),
+        'amount': amount,
+        'transaction_type': np.where(amount > 0, 'credit', 'debit'),
+        'category': df.get('Category', pd.Series('', index=df.index)).fillna(''),
+        'account': df.get('Account', pd.Series('', index=df.index)).fillna(''),
+        'fiscal_year': dt.dt.year,
+        'fiscal_quarter': dt.dt.quarter,
+        'month': dt.dt.month_name(),
+    })
+
+
+def transform_to_parquet(csv_file, output_dir=PARQUET_DIR):
+    """Preprocess one CSV and write it out as Parquet; returns the path."""
+    # pyarrow's CSV reader parses in parallel, unlike pd.read_csv.
+    table = pa_csv.read_csv(csv_file, read_options=pa_csv.ReadOptions(use_threads=True))
+    required = {'Date', 'Description', 'Amount'}
+    missing = required - set(table.column_names)
+    if missing:
+        raise ValueError(f"{csv_file} is missing columns: {sorted(missing)}")
+    df = table.to_pandas()
+    df = preprocess_transaction_data(df)
+    os.makedirs(output_dir, exist_ok=True)
+    name = os.path.splitext(os.path.basename(csv_file))[0] + '.parquet'
+    output_path = os.path.join(output_dir, name)
+    # Write through pyarrow directly; df.to_parquet would just convert to
+    # an Arrow table internally anyway, and this pins the compression.
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False),
+                   output_path, compression='zstd', use_dictionary=True)
+    return output_path
+
+
+def load_to_postgres(parquet_file, conn):
+    """Load one Parquet file into unified_transactions via COPY FROM STDIN.
+
+    Streaming over the connection works against remote databases too;
+    the old server-side COPY FROM '<path>' needed the file on the DB
+    host and superuser rights. The connection is owned by the caller
+    and reused across files.
+    """
+    table = pq.read_table(parquet_file)
+    buf = io.BytesIO()
+    pa_csv.write_csv(table, buf, pa_csv.WriteOptions(include_header=False))
+    buf.seek(0)
+    copy_buffer(conn, 'unified_transactions', COLUMNS, buf)
+    conn.commit()
+    print(f"Loaded {table.num_rows} rows from {os.path.basename(parquet_file)}")
+
+
+def _process_one(csv_file, conn_pool):
+    print(f"Processing {os.path.basename(csv_file)}...")
+    parquet_file = transform_to_parquet(csv_file)
+    conn = conn_pool.getconn()
+    try:
+        load_to_postgres(parquet_file, conn)
+    finally:
+        conn_pool.putconn(conn)
+
+
+def process_csv_files(csv_dir, conn_pool):
+    csv_files = [os.path.join(csv_dir, name)
+                 for name in sorted(os.listdir(csv_dir))
+                 if name.lower().endswith('.csv')]
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        list(ex.map(lambda p: _process_one(p, conn_pool), csv_files))
+
+
+def main():
+    csv_dir = sys.argv[1] if len(sys.argv) > 1 else 'csv_unified'
+    # Pooled connections: each worker thread checks one out per file,
+    # still no handshake/auth cost per file.
+    conn_pool = psycopg2.pool.ThreadedConnectionPool(1, MAX_WORKERS, **db_params)
+    try:
+        process_csv_files(csv_dir, conn_pool)
+    finally:
+        conn_pool.closeall()
+
+
+if __name__ == '__main__':
+    main()
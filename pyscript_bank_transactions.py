@@ -0,0 +1,117 @@
+"""Load bank transaction CSV exports into the bank_transactions table.
+
+Same pipeline shape as the other loaders: clean the raw CSV frame,
+stage it as Parquet, then COPY it into PostgreSQL.
+"""
+
+import io
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import psycopg2
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pa_csv
+
+from db_utils import copy_buffer
+
+db_params = {
+    'dbname': 'dashboards',
+    'user': 'postgres',
+    'password': os.environ.get('POSTGRES_PASSWORD', ''),
+    'host': 'localhost',
+    'port': 5432,
+}
+
+PARQUET_DIR = 'parquet_bank'
+
+COLUMNS = ['transaction_date', 'description', 'amount', 'transaction_type', 'balance']
+
+
+def clean_transaction_data(df):
+    """Build the bank_transactions layout from a raw bank CSV frame.
+
+    Returns a new frame holding only the output columns; the caller's
+    frame is read, never modified. Rows with unparseable dates are
+    dropped.
+    """
+    # Explicit format skips per-cell sniffing; cache=True dedupes repeat
+    # date strings. Unparseable dates are dropped rather than raising.
+    dt = pd.to_datetime(df['Date'], format='%m/%d/%Y', cache=True, errors='coerce')
+    valid = dt.notna()
+    df = df[valid]
+    dt = dt[valid]
+    # One regex pass for each currency column instead of chained replaces.
+    # The 'string' input makes to_numeric return nullable Float64, whose
+    # pd.NA would break the np.where mask below — cast back to float64
+    # so unparseable amounts become plain NaN.
+    amount = pd.to_numeric(
+        df['Amount'].astype('string').str.replace(r'[$,]', '', regex=True),
+        errors='coerce').astype('float64')
+    return pd.DataFrame({
+        'transaction_date': dt.dt.strftime('%Y-%m-%d'),
+        'description': df['Description'].astype(str).str.strip(),
+        'amount': amount,
+        'transaction_type': np.where(amount > 0, 'credit', 'debit'),
+        'balance': pd.to_numeric(
+            df['Balance'].astype('string').str.replace(r'[$,]', '', regex=True), errors='coerce'),
+    })
+
+
+def transform_to_parquet(csv_file, output_dir=PARQUET_DIR):
+    """Clean one CSV and write it out as Parquet; returns the path."""
+    # pyarrow's CSV reader parses in parallel, unlike pd.read_csv.
+    table = pa_csv.read_csv(csv_file, read_options=pa_csv.ReadOptions(use_threads=True))
+    required = {'Date', 'Description', 'Amount', 'Balance'}
+    missing = required - set(table.column_names)
+    if missing:
+        raise ValueError(f"{csv_file} is missing columns: {sorted(missing)}")
+    df = table.to_pandas()
+    df = clean_transaction_data(df)
+    os.makedirs(output_dir, exist_ok=True)
+    name = os.path.splitext(os.path.basename(csv_file))[0] + '.parquet'
+    output_path = os.path.join(output_dir, name)
+    # Write through pyarrow directly; df.to_parquet would just convert to
+    # an Arrow table internally anyway, and this pins the compression.
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False),
+                   output_path, compression='zstd', use_dictionary=True)
+    return output_path
+
+
+def load_to_postgres(parquet_file, conn):
+    """Load one Parquet file into bank_transactions via COPY FROM STDIN.
+
+    Streaming over the connection works against remote databases too;
+    the old server-side COPY FROM '<path>' needed the file on the DB
+    host and superuser rights. The connection is owned by the caller
+    and reused across files.
+    """
+    table = pq.read_table(parquet_file)
+    buf = io.BytesIO()
+    pa_csv.write_csv(table, buf, pa_csv.WriteOptions(include_header=False))
+    buf.seek(0)
+    copy_buffer(conn, 'bank_transactions', COLUMNS, buf)
+    conn.commit()
+    print(f"Loaded {table.num_rows} rows from {os.path.basename(parquet_file)}")
+
+
+def main():
+    csv_dir = sys.argv[1] if len(sys.argv) > 1 else 'csv_bank'
+    # One connection for the whole run: no handshake/auth per file.
+    conn = psycopg2.connect(**db_params)
+    try:
+        for name in sorted(os.listdir(csv_dir)):
+            if not name.lower().endswith('.csv'):
+                continue
+            csv_file = os.path.join(csv_dir, name)
+            print(f"Processing {name}...")
+            parquet_file = transform_to_parquet(csv_file)
+            load_to_postgres(parquet_file, conn)
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Checks that the scalar and vectorized fiscal-period paths agree.
+
+The stocks scripts derive fiscal periods twice — determine_fiscal_periods
+for row-wise use and vectorized column arithmetic in preprocess_data —
+so every month is asserted against the expected July-start mapping and
+the two paths are compared against each other.
+"""
+
+import pandas as pd
+import pytest
+
+import py_script_stocks
+import py_script_unified
+
+# July-start fiscal year: Jul-Sep=1, Oct-Dec=2, Jan-Mar=3, Apr-Jun=4.
+STOCKS_QUARTERS = {7: 1, 8: 1, 9: 1, 10: 2, 11: 2, 12: 2,
+                   1: 3, 2: 3, 3: 3, 4: 4, 5: 4, 6: 4}
+
+
+@pytest.mark.parametrize('month,quarter', sorted(STOCKS_QUARTERS.items()))
+def test_stocks_scalar_quarters(month, quarter):
+    periods = py_script_stocks.determine_fiscal_periods(pd.Timestamp(2024, month, 15))
+    assert periods['fiscal_quarter'] == quarter
+    assert periods['fiscal_year'] == (2025 if month >= 7 else 2024)
+    assert periods['month'] == pd.Timestamp(2024, month, 15).month_name()
+
+
+@pytest.mark.parametrize('month', range(1, 13))
+def test_unified_scalar_quarters(month):
+    periods = py_script_unified.determine_fiscal_periods(pd.Timestamp(2024, month, 15))
+    assert periods['fiscal_quarter'] == (month - 1) // 3 + 1
+    assert periods['fiscal_year'] == 2024
+
+
+def test_stocks_vectorized_matches_scalar():
+    df = pd.DataFrame({
+        'Date': [f'{m:02d}/15/2024' for m in range(1, 13)],
+        'Symbol': 'VTI',
+        'Description': 'Buy',
+        'Quantity': 1,
+        'Price': '$10.00',
+        'Amount': '$10.00',
+    })
+    out = py_script_stocks.preprocess_data(df)
+    assert len(out) == 12
+    for row in out.itertuples():
+        expected = py_script_stocks.determine_fiscal_periods(pd.Timestamp(row.transaction_date))
+        assert row.fiscal_year == expected['fiscal_year']
+        assert row.fiscal_quarter == expected['fiscal_quarter']
+        assert row.month == expected['month']
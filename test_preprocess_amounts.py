@@ -0,0 +1,34 @@
+"""Regression tests for unparseable Amount cells in the preprocess paths.
+
+Blank cells and parenthesized debits like ($5.00) coerce to NA; the
+transaction_type classification must tolerate that instead of raising
+on an ambiguous NA boolean.
+"""
+
+import pandas as pd
+
+import py_script_unified
+import pyscript_bank_transactions
+
+
+def test_unified_tolerates_unparseable_amounts():
+    df = pd.DataFrame({
+        'Date': ['01/15/2024', '02/15/2024', '03/15/2024'],
+        'Description': ['clean', 'blank amount', 'paren debit'],
+        'Amount': ['$10.00', '', '($5.00)'],
+    })
+    out = py_script_unified.preprocess_transaction_data(df)
+    assert list(out['transaction_type']) == ['credit', 'debit', 'debit']
+    assert out['amount'].isna().tolist() == [False, True, True]
+
+
+def test_bank_tolerates_unparseable_amounts():
+    df = pd.DataFrame({
+        'Date': ['01/15/2024', '02/15/2024', '03/15/2024'],
+        'Description': ['clean', 'blank amount', 'paren debit'],
+        'Amount': ['$10.00', '', '($5.00)'],
+        'Balance': ['$100.00', '$90.00', '$85.00'],
+    })
+    out = pyscript_bank_transactions.clean_transaction_data(df)
+    assert list(out['transaction_type']) == ['credit', 'debit', 'debit']
+    assert out['amount'].isna().tolist() == [False, True, True]